@@ -6,22 +6,28 @@
 
 """Collection of function for flexible nodes/edges access, to be used by model building and manipulation operations"""
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
 import libsonata
 from bluepysnap.sonata_constants import Node, DYNAMICS_PREFIX
 from bluepysnap.utils import add_dynamic_prefix
-from bluepysnap.utils import euler2mat, quaternion2mat
+from bluepysnap.utils import euler2mat
 from sklearn.model_selection import KFold
 
 from connectome_manipulator import log
 
+# Minimum number of quaternions for which the (optional) Numba kernel is used
+QUAT2MAT_NUMBA_THRESHOLD = 10000
+
 
+@lru_cache(maxsize=32)
 def property_names(nodes):
-    """Get all property names for a population"""
+    """Get all property names for a population (cached per population)"""
     population = nodes.to_libsonata
-    return set(population.attribute_names) | set(
+    return frozenset(population.attribute_names) | frozenset(
         add_dynamic_prefix(population.dynamics_attribute_names)
     )
 
@@ -37,19 +43,16 @@ def get_nodes(nodes, selection=None):
     categoricals = population.enumeration_names
 
     if selection is None:
-        selection = nodes.select_all()
+        selection = population.select_all()
     result = pd.DataFrame(index=selection.flatten())
 
     for attr in sorted(population.attribute_names):
         if attr in categoricals:
             enumeration = np.asarray(population.get_enumeration(attr, selection))
             values = np.asarray(population.enumeration_values(attr))
-            # if the size of `values` is large enough compared to `enumeration`, not using
-            # categorical reduces the memory usage.
-            if values.shape[0] < 0.5 * enumeration.shape[0]:
-                result[attr] = pd.Categorical.from_codes(enumeration, categories=values)
-            else:
-                result[attr] = values[enumeration]
+            # Categorical avoids materializing an object array of all N values; use
+            # .astype(str) downstream where plain strings are required
+            result[attr] = pd.Categorical.from_codes(enumeration, categories=values)
         else:
             result[attr] = population.get_attribute(attr, selection)
     for attr in sorted(add_dynamic_prefix(population.dynamics_attribute_names)):
@@ -57,6 +60,83 @@ def get_nodes(nodes, selection=None):
     return result
 
 
+def _quat2mat_batch(wxyz):
+    """Build rotation matrices from an (N, 4) array of (w, x, y, z) quaternions.
+
+    Equivalent to bluepysnap's ``quaternion2mat`` (incl. normalization), but evaluated as a
+    single vectorized kernel over all quaternions and returned as an (N, 3, 3) array.
+    """
+    wxyz = np.asarray(wxyz)
+    wxyz = wxyz / np.sqrt(np.einsum("...i,...i", wxyz, wxyz)).reshape(-1, 1)
+    w, x, y, z = wxyz.T
+    ww, xx, yy, zz = w * w, x * x, y * y, z * z
+    wx, wy, wz = w * x, w * y, w * z
+    xy, xz, yz = x * y, x * z, y * z
+
+    mats = np.empty((wxyz.shape[0], 3, 3), dtype=wxyz.dtype)
+    mats[:, 0, 0] = ww + xx - yy - zz
+    mats[:, 0, 1] = 2 * (xy - wz)
+    mats[:, 0, 2] = 2 * (wy + xz)
+    mats[:, 1, 0] = 2 * (wz + xy)
+    mats[:, 1, 1] = ww - xx + yy - zz
+    mats[:, 1, 2] = 2 * (yz - wx)
+    mats[:, 2, 0] = 2 * (xz - wy)
+    mats[:, 2, 1] = 2 * (wx + yz)
+    mats[:, 2, 2] = ww - xx - yy + zz
+    return mats
+
+
+@lru_cache(maxsize=None)
+def _get_quat2mat_nb():
+    """Lazily compile the Numba version of the quaternion kernel (None if Numba is not available)"""
+    try:
+        import numba  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def quat_to_matrix_nb(wxyz, out):
+        """Single-pass version of _quat2mat_batch(), writing into an (N, 3, 3) output array"""
+        for i in numba.prange(wxyz.shape[0]):  # pylint: disable=not-an-iterable
+            norm = np.sqrt(
+                wxyz[i, 0] * wxyz[i, 0]
+                + wxyz[i, 1] * wxyz[i, 1]
+                + wxyz[i, 2] * wxyz[i, 2]
+                + wxyz[i, 3] * wxyz[i, 3]
+            )
+            w = wxyz[i, 0] / norm
+            x = wxyz[i, 1] / norm
+            y = wxyz[i, 2] / norm
+            z = wxyz[i, 3] / norm
+            ww, xx, yy, zz = w * w, x * x, y * y, z * z
+            wx, wy, wz = w * x, w * y, w * z
+            xy, xz, yz = x * y, x * z, y * z
+            out[i, 0, 0] = ww + xx - yy - zz
+            out[i, 0, 1] = 2 * (xy - wz)
+            out[i, 0, 2] = 2 * (wy + xz)
+            out[i, 1, 0] = 2 * (wz + xy)
+            out[i, 1, 1] = ww - xx + yy - zz
+            out[i, 1, 2] = 2 * (yz - wx)
+            out[i, 2, 0] = 2 * (xz - wy)
+            out[i, 2, 1] = 2 * (wx + yz)
+            out[i, 2, 2] = ww - xx - yy + zz
+
+    return quat_to_matrix_nb
+
+
+def _quat2mat(wxyz):
+    """Build rotation matrices from (w, x, y, z) quaternions, using Numba for large arrays if available"""
+    quat_to_matrix_nb = None
+    if len(wxyz) > QUAT2MAT_NUMBA_THRESHOLD:
+        quat_to_matrix_nb = _get_quat2mat_nb()
+    if quat_to_matrix_nb is None:
+        return _quat2mat_batch(wxyz)
+    wxyz = np.ascontiguousarray(wxyz)
+    mats = np.empty((wxyz.shape[0], 3, 3), dtype=wxyz.dtype)
+    quat_to_matrix_nb(wxyz, mats)
+    return mats
+
+
 def orientations(nodes, node_sel=None):
     """Node orientation(s) as a list of numpy arrays.
 
@@ -68,19 +148,18 @@ def orientations(nodes, node_sel=None):
         numpy.ndarray:
             A list of 3x3 rotation matrices for the given node set and selection.
     """
-    # need to keep this quaternion ordering for quaternion2mat (expects w, x, y , z)
+    # need to keep this quaternion ordering for _quat2mat (expects w, x, y , z)
     props = np.array(
         [Node.ORIENTATION_W, Node.ORIENTATION_X, Node.ORIENTATION_Y, Node.ORIENTATION_Z]
     )
-    props_mask = np.isin(props, list(property_names(nodes)))
+    names = property_names(nodes)
+    props_mask = np.array([prop in names for prop in props])
     orientation_count = np.count_nonzero(props_mask)
-    if orientation_count == 4:
-        trans = quaternion2mat
-    elif orientation_count in [1, 2, 3]:
+    if orientation_count in [1, 2, 3]:
         raise ValueError(
             "Missing orientation fields. Should be 4 quaternions or euler angles or nothing"
         )
-    else:
+    if orientation_count == 0:
         # need to keep this rotation_angle ordering for euler2mat (expects z, y, x)
         props = np.array(
             [
@@ -89,60 +168,196 @@ def orientations(nodes, node_sel=None):
                 Node.ROTATION_ANGLE_X,
             ]
         )
-        props_mask = np.isin(props, list(property_names(nodes)))
-        trans = euler2mat
-    result = get_nodes(nodes, node_sel)
-    if props[props_mask].size:
-        result = result[props[props_mask]]
+        props_mask = np.array([prop in names for prop in props])
 
-    def _get_values(prop):
-        """Retrieve prop from the result Dataframe/Series."""
-        if isinstance(result, pd.Series):
-            return [result.get(prop, 0)]
-        return result.get(prop, np.zeros((result.shape[0],)))
+    # Read only the required attributes into a contiguous (N, 3|4) array; missing ones are zero
+    population = nodes.to_libsonata
+    if node_sel is None:
+        node_sel = population.select_all()
+    values = np.column_stack(
+        [
+            population.get_attribute(prop, node_sel) if mask else np.zeros(node_sel.flat_size)
+            for prop, mask in zip(props, props_mask)
+        ]
+    )
+    if orientation_count == 4:
+        return _quat2mat(values)
+    return euler2mat(*values.T)
 
-    args = [_get_values(prop) for prop in props]
-    return trans(*args)
 
+def rotate_vectors_from_quaternions(wxyz, vecs):
+    """Rotate vectors by (w, x, y, z) quaternions, without building the rotation matrices.
 
-def get_enumeration_list(pop, column):
-    """Takes a node population and column name and returns a list to values."""
+    Args:
+        wxyz: an (N, 4) array of quaternions (normalized internally, as in orientations())
+        vecs: an (N, 3) array of vectors, one per quaternion, or a single (3,) vector
+
+    Returns:
+        numpy.ndarray:
+            The (N, 3) array of rotated vectors, same as ``_quat2mat_batch(wxyz) @ vecs``.
+    """
+    wxyz = np.asarray(wxyz)
+    wxyz = wxyz / np.sqrt(np.einsum("...i,...i", wxyz, wxyz)).reshape(-1, 1)
+    w = wxyz[:, :1]
+    q_vec = wxyz[:, 1:]
+    vecs = np.asarray(vecs)
+    # v' = v + w * t + q x t, with t = 2 * (q x v)
+    t = 2 * np.cross(q_vec, vecs)
+    return vecs + w * t + np.cross(q_vec, t)
+
+
+@lru_cache(maxsize=128)
+def _enumeration_values(pop, column):
+    """Cached (sorted) values of `column` of node population `pop`"""
     raw_pop = pop.to_libsonata
     if column in raw_pop.enumeration_names:
-        return raw_pop.enumeration_values(column)
-    return sorted(np.unique(raw_pop.get_attribute(column, raw_pop.select_all())))
+        return tuple(raw_pop.enumeration_values(column))
+    # np.unique() already returns sorted values, no need for a (Python-level) sort
+    return tuple(np.unique(raw_pop.get_attribute(column, raw_pop.select_all())))
+
+
+@lru_cache(maxsize=128)
+def _enumeration_map(pop, column):
+    """Cached mapping from values of `column` of node population `pop` to indices (not to be modified)"""
+    return {key: idx for idx, key in enumerate(_enumeration_values(pop, column))}
+
+
+def get_enumeration_list(pop, column):
+    """Takes a node population and column name and returns a list to values."""
+    return list(_enumeration_values(pop, column))
 
 
 def get_enumeration_map(pop, column):
     """Takes a node population and column name and returns a dictionary that maps values to indices."""
-    raw_pop = pop.to_libsonata
-    if column in raw_pop.enumeration_names:
-        return {key: idx for idx, key in enumerate(raw_pop.enumeration_values(column))}
-    return {
-        key: idx
-        for idx, key in enumerate(
-            sorted(np.unique(raw_pop.get_attribute(column, raw_pop.select_all())))
-        )
-    }
+    return dict(_enumeration_map(pop, column))
+
+
+def _selection_from_ids(ids):
+    """Turn node IDs into a libsonata.Selection (passing through existing selections)
+
+    A contiguous range of IDs (e.g., a block of a split) is turned into a single range directly.
+    """
+    if isinstance(ids, libsonata.Selection):
+        return ids
+    ids = np.asarray(ids)
+    if (
+        ids.ndim == 1
+        and len(ids) > 1
+        and ids[-1] - ids[0] + 1 == len(ids)
+        and np.all(ids[1:] > ids[:-1])
+    ):
+        return libsonata.Selection([(int(ids[0]), int(ids[-1]) + 1)])
+    return libsonata.Selection(ids)
 
 
 def get_attribute(pop, column, ids):
-    """Get the attribute values for `column` from population `pop` for node IDs `ids`."""
+    """Get the attribute values for `column` from population `pop` for node IDs `ids`.
+
+    `ids` can be given as an array of node IDs or as a libsonata.Selection, so that callers
+    accessing multiple attributes of the same nodes can build the selection only once.
+    """
     raw_pop = pop.to_libsonata
-    return raw_pop.get_attribute(column, libsonata.Selection(ids))
+    return raw_pop.get_attribute(column, _selection_from_ids(ids))
 
 
 def get_enumeration(pop, column, ids=None):
-    """Get the raw enumeration values for `column` from population `pop` for node IDs `ids`."""
+    """Get the raw enumeration values for `column` from population `pop` for node IDs `ids`.
+
+    `ids` can be given as an array of node IDs or as a libsonata.Selection.
+    """
     raw_pop = pop.to_libsonata
     if ids is None:
         ids = raw_pop.select_all()
     else:
-        ids = libsonata.Selection(ids)
+        ids = _selection_from_ids(ids)
     if column in raw_pop.enumeration_names:
         return raw_pop.get_enumeration(column, ids)
-    mapping = get_enumeration_map(pop, column)
-    return np.array([mapping[v] for v in raw_pop.get_attribute(column, ids)])
+    # Sorted keys, same ordering as in get_enumeration_map()
+    keys = np.asarray(_enumeration_values(pop, column))
+    return np.searchsorted(keys, raw_pop.get_attribute(column, ids)).astype(np.int64)
+
+
+def _sorted_unique(ids):
+    """Return ids as a sorted array of unique values, skipping the sort if already the case"""
+    ids = np.asarray(ids)
+    if np.all(ids[1:] > ids[:-1]):
+        return ids
+    return np.unique(ids)
+
+
+def _intersect_ids(ids, other, other_sorted=False):
+    """Same as np.intersect1d(ids, other), but using a binary search instead of sorting the
+    concatenated arrays, which is cheap for already sorted node IDs"""
+    ids = _sorted_unique(ids)
+    if not other_sorted:
+        other = _sorted_unique(other)
+    if other.size == 0:
+        return ids[:0]
+    pos = np.minimum(np.searchsorted(other, ids), other.size - 1)
+    return ids[other[pos] == ids]
+
+
+@lru_cache(maxsize=16)
+def _node_set_ids(nodes, node_set):
+    """Cached (sorted, read-only) node IDs of `node_set` in nodes population"""
+    ids = nodes.ids(node_set)
+    ids.flags.writeable = False
+    return ids
+
+
+def _freeze_selection(sel_group):
+    """Turn a property selection dict into a hashable key, keeping track of list values"""
+    return tuple(
+        sorted(
+            (sel_k, tuple(sel_v), True) if isinstance(sel_v, list) else (sel_k, sel_v, False)
+            for sel_k, sel_v in sel_group.items()
+        )
+    )
+
+
+def _build_selector(nodes, frozen_sel):
+    """Returns a function selector(pop, sel_ids) computing the boolean selection mask of the
+    given (frozen) property selection, with enumeration lookups resolved once up front.
+    Returns None from the selector if there is nothing to select on."""
+    enumeration_names = nodes.to_libsonata.enumeration_names
+    criteria = []
+    for sel_k, sel_v, is_list in frozen_sel:
+        if sel_k in enumeration_names:
+            enum_map = _enumeration_map(nodes, sel_k)
+            sel_v = [enum_map[_v] for _v in sel_v] if is_list else enum_map[sel_v]
+            getter = "get_enumeration"
+        else:
+            sel_v = list(sel_v) if is_list else sel_v
+            getter = "get_attribute"
+        criteria.append((getter, sel_k, sel_v, is_list))
+
+    def selector(pop, sel_ids):
+        selection = None
+        for getter, sel_k, sel_v, is_list in criteria:
+            values = getattr(pop, getter)(sel_k, sel_ids)
+            if is_list:  # Merge multiple selections
+                sel_prop = np.isin(values, sel_v)
+            else:  # Single selection
+                sel_prop = values == sel_v
+            if selection is None:
+                selection = sel_prop
+            else:
+                selection &= sel_prop
+        return selection
+
+    return selector
+
+
+_make_selector = lru_cache(maxsize=128)(_build_selector)
+
+
+def _get_selector(nodes, sel_group):
+    """Get the (cached) selector function for a property selection dict of nodes population"""
+    frozen_sel = _freeze_selection(sel_group)
+    try:
+        return _make_selector(nodes, frozen_sel)
+    except TypeError:  # Unhashable selection values, cannot be cached
+        return _build_selector(nodes, frozen_sel)
 
 
 def get_node_ids(nodes, sel_spec, split_ids=None):
@@ -156,33 +371,15 @@ def get_node_ids(nodes, sel_spec, split_ids=None):
                   libsonata.Selection
     """
     pop = nodes.to_libsonata
-    enumeration_names = pop.enumeration_names
     if split_ids is None:
         sel_ids = pop.select_all()
     else:
-        sel_ids = libsonata.Selection(split_ids)
+        sel_ids = _selection_from_ids(split_ids)
     if isinstance(sel_spec, dict):
         sel_group = sel_spec.copy()
         node_set = sel_group.pop("node_set", None)
 
-        selection = None
-        for sel_k, sel_v in sel_group.items():
-            if sel_k in enumeration_names:
-                if isinstance(sel_v, list):  # Merge multiple selections
-                    sel_idx = [pop.enumeration_values(sel_k).index(_v) for _v in sel_v]
-                    sel_prop = np.isin(pop.get_enumeration(sel_k, sel_ids), sel_idx)
-                else:  # Single selection
-                    sel_idx = pop.enumeration_values(sel_k).index(sel_v)
-                    sel_prop = pop.get_enumeration(sel_k, sel_ids) == sel_idx
-            else:
-                if isinstance(sel_v, list):  # Merge multiple selections
-                    sel_prop = np.isin(pop.get_attribute(sel_k, sel_ids), sel_v)
-                else:  # Single selection
-                    sel_prop = pop.get_attribute(sel_k, sel_ids) == sel_v
-            if selection is None:
-                selection = sel_prop
-            else:
-                selection &= sel_prop
+        selection = _get_selector(nodes, sel_group)(pop, sel_ids)
         # selection is not of all nodes (starting with node id 0), but a generic subset specified by sel_ids
         if len(sel_ids.ranges) == 1:
             # First turn selection array into an index array then
@@ -194,16 +391,24 @@ def get_node_ids(nodes, sel_spec, split_ids=None):
 
         if node_set is not None:
             log.log_assert(isinstance(node_set, str), "Node set must be a string!")
+            node_set_ids = _node_set_ids(nodes, node_set)
             if selection is None:  # Nothing else selected
-                gids = nodes.ids(node_set)
-                if split_ids is not None:
-                    gids = np.intersect1d(gids, sel_ids.flatten().astype(np.int64))
+                if split_ids is None:
+                    gids = node_set_ids.copy()
+                else:
+                    gids = _intersect_ids(
+                        sel_ids.flatten().astype(np.int64), node_set_ids, other_sorted=True
+                    )
             else:  # Otherwise, intersect with selection
-                gids = np.intersect1d(gids, nodes.ids(node_set))
+                gids = _intersect_ids(gids, node_set_ids, other_sorted=True)
+    elif isinstance(sel_spec, str) and split_ids is not None:  # Node set, filtered by split
+        gids = _intersect_ids(
+            sel_ids.flatten().astype(np.int64), _node_set_ids(nodes, sel_spec), other_sorted=True
+        )
     else:
         gids = nodes.ids(sel_spec)
         if split_ids is not None:
-            gids = np.intersect1d(gids, sel_ids.flatten().astype(np.int64))
+            gids = _intersect_ids(gids, sel_ids.flatten().astype(np.int64))
 
     return gids
 
@@ -258,7 +463,7 @@ def get_edges_population(circuit, popul_name=None, return_popul_name=False):
 def get_node_positions(nodes, node_ids, vox_map=None):
     """Return x/y/z positions of list of nodes, optionally mapped using VoxelData map."""
     _pop = nodes.to_libsonata
-    _sel = libsonata.Selection(node_ids)
+    _sel = _selection_from_ids(node_ids)
     raw_pos = np.column_stack(
         (
             _pop.get_attribute("x", _sel),
@@ -19,9 +19,23 @@ from scipy.sparse import csc_matrix
 from connectome_manipulator.access_functions import (
     get_edges_population,
     get_node_ids,
-    get_connections,
 )
 
+# Data type of synapse count matrices
+COUNT_DTYPE = np.uint16
+
+
+def _get_gid_to_idx(node_ids):
+    """Returns a function mapping node IDs to their indices in node_ids (-1 if not contained)"""
+    sort_idx = np.argsort(node_ids, kind="stable")
+    sorted_ids = np.asarray(node_ids)[sort_idx]
+
+    def gid_to_idx(gids):
+        pos = np.minimum(np.searchsorted(sorted_ids, gids), len(sorted_ids) - 1)
+        return np.where(sorted_ids[pos] == gids, sort_idx[pos], -1)
+
+    return gid_to_idx
+
 
 def compute(circuit, sel_src=None, sel_dest=None, edges_popul_name=None, **_):
     """Extracts adjacency and count matrices from a given circuit's connectome.
@@ -56,41 +70,43 @@ def compute(circuit, sel_src=None, sel_dest=None, edges_popul_name=None, **_):
     ), "ERROR: Empty source/target node selection(s)!"
 
     # Map source/target node ids to continuous range of indices for plotting
-    src_gid_min = min(src_nodes.ids())
-    src_gid_max = max(src_nodes.ids())
-    tgt_gid_min = min(tgt_nodes.ids())
-    tgt_gid_max = max(tgt_nodes.ids())
-
-    src_plot_ids = np.full(src_gid_max - src_gid_min + 1, -1).astype(int)
-    src_gid_offset = src_gid_min
-    src_plot_ids[src_node_ids - src_gid_offset] = np.arange(len(src_node_ids))
-
-    def src_gid_to_idx(gids):
-        return src_plot_ids[gids - src_gid_offset]
-
-    tgt_plot_ids = np.full(tgt_gid_max - tgt_gid_min + 1, -1).astype(int)
-    tgt_gid_offset = tgt_gid_min
-    tgt_plot_ids[tgt_node_ids - tgt_gid_offset] = np.arange(len(tgt_node_ids))
-
-    def tgt_gid_to_idx(gids):
-        return tgt_plot_ids[gids - tgt_gid_offset]
+    src_gid_to_idx = _get_gid_to_idx(src_node_ids)
+    tgt_gid_to_idx = _get_gid_to_idx(tgt_node_ids)
 
     print(
         f"INFO: Creating {len(src_node_ids)}x{len(tgt_node_ids)} adjacency matrix (sel_src={sel_src}, sel_dest={sel_dest})",
         flush=True,
     )
 
-    conns = get_connections(edges, src_node_ids, tgt_node_ids, with_nsyn=True)
-    if len(conns) == 0:  # No connections, creating empty matrix
-        count_matrix = csc_matrix((len(src_node_ids), len(tgt_node_ids)), dtype=int)
-    else:
-        count_matrix = csc_matrix(
-            (conns[:, 2], (src_gid_to_idx(conns[:, 0]), tgt_gid_to_idx(conns[:, 1]))),
-            shape=(len(src_node_ids), len(tgt_node_ids)),
-            dtype=int,
+    # Bulk-read source/target node IDs of all edges targeting the selected nodes; synapses
+    # belonging to the same connection are summed up when building the sparse matrix
+    edges_pop = edges.to_libsonata
+    edge_sel = edges_pop.afferent_edges(tgt_node_ids)
+    syn_src = edges_pop.source_nodes(edge_sel).astype(np.int64)
+    syn_tgt = edges_pop.target_nodes(edge_sel).astype(np.int64)
+    src_idx = src_gid_to_idx(syn_src)
+    src_mask = src_idx >= 0
+    count_matrix = csc_matrix(
+        (
+            np.ones(np.count_nonzero(src_mask), dtype=int),
+            (src_idx[src_mask], tgt_gid_to_idx(syn_tgt[src_mask])),
+        ),
+        shape=(len(src_node_ids), len(tgt_node_ids)),
+        dtype=int,
+    )
+
+    # Store synapse counts with a small dtype (saturating in case of overflow)
+    count_max = np.iinfo(COUNT_DTYPE).max
+    if count_matrix.nnz > 0 and count_matrix.data.max() > count_max:
+        print(
+            f"WARNING: Synapse counts exceeding {count_max} per connection will be clipped!",
+            flush=True,
         )
+        np.minimum(count_matrix.data, count_max, out=count_matrix.data)
+    count_matrix = count_matrix.astype(COUNT_DTYPE)
 
-    adj_matrix = csc_matrix(count_matrix > 0)
+    # Count matrix has no explicitly stored zeros, so casting keeps the same sparsity structure
+    adj_matrix = count_matrix.astype(bool)
 
     return {
         "adj": {"data": adj_matrix, "name": "Adjacency", "unit": None},
@@ -22,12 +22,12 @@ class DaskExecutor:
         """Initializes the executor wrapper"""
         self._executor = executor
         self._result_hook = result_hook
-        self._jobs = []
+        self._jobs = as_completed()
         self._last_processing = datetime.now()
 
     def _timed_process_jobs(self) -> bool:
         if datetime.now() - self._last_processing > self._PROCESS_INTERVAL:
-            self.process_jobs(self._jobs)
+            self.process_jobs(block=False)
             # Use the time after processing to get an evenly timed job submission window
             self._last_processing = datetime.now()
 
@@ -35,21 +35,20 @@ class DaskExecutor:
         """Submits a new routine to be run by the distributed framework"""
         job = self._executor.submit(func, *args)
         job.extra_data = extra_data
+        self._jobs.add(job)
         self._timed_process_jobs()
-        self._jobs.append(job)
 
-    def process_jobs(self, jobs=None):
-        """Process completed jobs, blocking to wait for all jobs if none are passed"""
-        if not jobs:
-            jobs = as_completed(self._jobs)
-        self._jobs = []
+    def process_jobs(self, block=True):
+        """Process completed jobs in order of completion
+
+        If blocking, waits for all submitted jobs to finish, otherwise only processes the jobs
+        that are already done.
+        """
+        jobs = self._jobs if block else self._jobs.next_batch(block=False)
         for job in jobs:
-            if job.done():
-                if self._result_hook:
-                    self._result_hook(job.result(), job.extra_data)
-                job.release()
-            else:
-                self._jobs.append(job)
+            if self._result_hook:
+                self._result_hook(job.result(), job.extra_data)
+            job.release()
 
 
 class SerialExecutor:
@@ -86,18 +85,25 @@ class AddProcessPool(WorkerPlugin):
             worker.executors["default"] = ProcessPoolExecutor(max_workers=worker.state.nthreads)
 
 
+def _coerce(val):
+    """Converts a string parameter value to int or float, if possible"""
+    for numeric_type in (int, float):
+        try:
+            return numeric_type(val)
+        except ValueError:
+            pass
+    return val
+
+
 @contextmanager
 def dask_ctx(result_hook, executor_params: dict):
     """An executor using the Dask system"""
     from dask.distributed import Client
 
     # Dask requires numeric params to go as the native type
-    for k, val in executor_params.items():
-        if val.isdecimal():
-            try:
-                executor_params[k] = int(val)
-            except ValueError:
-                executor_params[k] = float(val)
+    executor_params = {
+        k: _coerce(val) if isinstance(val, str) else val for k, val in executor_params.items()
+    }
 
     with Client(**executor_params) as client:
         client.register_worker_plugin(AddProcessPool())
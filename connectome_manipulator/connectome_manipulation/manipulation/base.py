@@ -96,9 +96,9 @@ class MorphologyCachingManipulation(Manipulation):
     @profiler.profileit(name="morphology_reading")
     def _get_tgt_morphs(self, morph_ext, tgt_node_sel):
         """Access function (incl. transformation!), using specified format (swc/h5/...)"""
-        result = access_functions.get_nodes(self.nodes[1], tgt_node_sel)
+        basenames = self.nodes[1].to_libsonata.get_attribute(Node.MORPHOLOGY, tgt_node_sel)
         return self._transform(
-            self._get_cached_morphs(morph_ext, tuple(result[Node.MORPHOLOGY])),
+            self._get_cached_morphs(morph_ext, tuple(basenames)),
             tgt_node_sel,
         )
 
@@ -114,8 +114,10 @@ class MorphologyCachingManipulation(Manipulation):
 
     def _transform(self, morphs, node_sel):
         rotations = access_functions.orientations(self.nodes[1], node_sel)
-        positions = access_functions.get_nodes(self.nodes[1], node_sel)
-        positions = positions[[Node.X, Node.Y, Node.Z]].to_numpy()
+        population = self.nodes[1].to_libsonata
+        positions = np.column_stack(
+            [population.get_attribute(_prop, node_sel) for _prop in [Node.X, Node.Y, Node.Z]]
+        )
         for m, r, p in zip(morphs, rotations, positions):
             T = np.eye(4)
             T[:3, :3] = r
@@ -363,6 +363,8 @@ class ConnectomeRewiring(MorphologyCachingManipulation):
             edges_table.shape[0], False
         )  # Global synapse indices to keep track of all rewired synapses [for data logging]
         new_edges_list = []  # New edges list to collect all generated synapses
+        src_mtypes = get_enumeration(self.nodes[0], "mtype", src_node_ids)
+        tgt_mtypes = get_enumeration(self.nodes[1], "mtype", tgt_node_ids)
         for tidx, (tgt, morph) in enumerate(zip(tgt_node_ids, tgt_morphs)):
             syn_sel_idx_tgt = edges_table["@target_node"] == tgt
             syn_sel_idx = np.logical_and(syn_sel_idx_tgt, syn_sel_idx_src)
@@ -385,8 +387,8 @@ class ConnectomeRewiring(MorphologyCachingManipulation):
                 p_model.apply(
                     src_pos=src_pos,
                     tgt_pos=tgt_pos[tidx : tidx + 1, :],
-                    src_type=get_enumeration(self.nodes[0], "mtype", src_node_ids),
-                    tgt_type=get_enumeration(self.nodes[1], "mtype", [tgt]),
+                    src_type=src_mtypes,
+                    tgt_type=tgt_mtypes[tidx : tidx + 1],
                     src_nid=src_node_ids,
                     tgt_nid=[tgt],
                 ).flatten()
@@ -148,8 +148,9 @@ class ConnectomeWiring(MorphologyCachingManipulation):
 
             # Determine source/target nodes for wiring
             src_node_ids = get_node_ids(self.nodes[0], sel_src)
-            src_class = get_attribute(self.nodes[0], "synapse_class", src_node_ids)
-            src_mtypes = get_enumeration(self.nodes[0], "mtype", src_node_ids)
+            src_node_sel = libsonata.Selection(src_node_ids)
+            src_class = get_attribute(self.nodes[0], "synapse_class", src_node_sel)
+            src_mtypes = get_enumeration(self.nodes[0], "mtype", src_node_sel)
             log.log_assert(len(src_node_ids) > 0, "No source nodes selected!")
 
             tgt_node_ids = tgt_node_ids[tgt_sel]  # Select subset of neurons (keeping order)
@@ -343,8 +344,9 @@ class ConnectomeWiring(MorphologyCachingManipulation):
 
             # Select source/target nodes
             src_node_ids = src_nodes.ids({"mtype": pre_type})
-            src_class = get_attribute(src_nodes, "synapse_class", src_node_ids)
-            src_mtypes = get_enumeration(src_nodes, "mtype", src_node_ids)
+            src_node_sel = libsonata.Selection(src_node_ids)
+            src_class = get_attribute(src_nodes, "synapse_class", src_node_sel)
+            src_mtypes = get_enumeration(src_nodes, "mtype", src_node_sel)
             src_positions = src_nodes.positions(
                 src_node_ids
             ).to_numpy()  # OPTIONAL: Coordinate system transformation may be added here
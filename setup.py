@@ -45,7 +45,7 @@ setup(
     ],
     packages=find_packages(),
     python_requires=">=3.10",
-    extras_require={"docs": ["sphinx", "sphinx-bluebrain-theme"]},
+    extras_require={"docs": ["sphinx", "sphinx-bluebrain-theme"], "numba": ["numba"]},
     entry_points={
         "console_scripts": [
             "connectome-manipulator=connectome_manipulator.cli:app",
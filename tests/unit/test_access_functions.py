@@ -6,11 +6,14 @@
 
 import os
 
+import libsonata
 import numpy as np
+import pandas as pd
 import pytest
 import re
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 from bluepysnap import BluepySnapError, Circuit
+from bluepysnap.utils import quaternion2mat
 from voxcell import VoxelData
 
 from utils import TEST_DATA_DIR
@@ -39,6 +42,156 @@ def test_get_node_ids():
             ref_ids = np.intersect1d(nodes.ids(node_set), nodes.ids({"layer": lay}))
             assert_array_equal(ids, ref_ids)
 
+    # Check filtering by (sorted or unsorted) split IDs
+    np.random.seed(0)
+    split_ids = np.sort(np.random.choice(nodes.ids(), nodes.size // 2, replace=False))
+    for split in [split_ids, split_ids[::-1], libsonata.Selection(split_ids)]:
+        for node_set in list(circuit.node_sets.content.keys()):
+            ids = test_module.get_node_ids(nodes, node_set, split)
+            assert_array_equal(ids, np.intersect1d(nodes.ids(node_set), split_ids))
+            for lay in layers:
+                ids = test_module.get_node_ids(nodes, {"node_set": node_set, "layer": lay}, split)
+                ref_ids = np.intersect1d(nodes.ids(node_set), nodes.ids({"layer": lay}))
+                assert_array_equal(ids, np.intersect1d(ref_ids, split_ids))
+    for lay in layers:
+        ids = test_module.get_node_ids(nodes, {"layer": lay}, split_ids)
+        assert_array_equal(ids, np.intersect1d(nodes.ids({"layer": lay}), split_ids))
+
+    # Check list selections and selector reuse across calls with the same schema
+    ids = test_module.get_node_ids(nodes, {"layer": layers[:2]})
+    assert_array_equal(ids, np.intersect1d(nodes.ids(), nodes.ids({"layer": layers[:2]})))
+    selector = test_module._get_selector(nodes, {"layer": layers[:2]})
+    assert test_module._get_selector(nodes, {"layer": list(layers[:2])}) is selector
+    assert test_module._get_selector(nodes, {"layer": layers[0]}) is not selector
+
+    # Node set IDs are resolved once and shared across calls, but never handed out directly
+    node_set = list(circuit.node_sets.content.keys())[0]
+    ids = test_module.get_node_ids(nodes, {"node_set": node_set})
+    assert ids.flags.writeable
+    assert test_module._node_set_ids(nodes, node_set) is test_module._node_set_ids(nodes, node_set)
+
+
+def test_selection_from_ids():
+    # Contiguous range of IDs
+    ids = np.arange(5, 15)
+    sel = test_module._selection_from_ids(ids)
+    assert sel.ranges == [(5, 15)]
+    assert_array_equal(sel.flatten(), ids)
+
+    # Non-contiguous, unsorted, and single/no IDs
+    for ids in [np.array([1, 2, 5, 6]), np.array([4, 3, 2, 1]), np.array([7]), np.array([])]:
+        assert_array_equal(test_module._selection_from_ids(ids).flatten(), ids)
+
+    # Selection passed through
+    sel = libsonata.Selection([(0, 3)])
+    assert test_module._selection_from_ids(sel) is sel
+
+
+def test_get_nodes():
+    circuit = Circuit(os.path.join(TEST_DATA_DIR, "circuit_sonata.json"))
+    nodes = circuit.nodes[circuit.nodes.population_names[0]]
+    raw_pop = nodes.to_libsonata
+    node_ids = nodes.ids()[::2]
+
+    # Case 1: All nodes
+    res = test_module.get_nodes(nodes)
+    assert_array_equal(res.index, nodes.ids())
+
+    # Case 2: Node selection
+    res = test_module.get_nodes(nodes, libsonata.Selection(node_ids))
+    assert_array_equal(res.index, node_ids)
+    for attr in raw_pop.attribute_names:
+        if attr in raw_pop.enumeration_names:
+            assert isinstance(res[attr].dtype, pd.CategoricalDtype)
+        assert_array_equal(
+            res[attr].to_numpy(), raw_pop.get_attribute(attr, libsonata.Selection(node_ids))
+        )
+
+
+def test_get_enumeration():
+    circuit = Circuit(os.path.join(TEST_DATA_DIR, "circuit_sonata.json"))
+    nodes = circuit.nodes[circuit.nodes.population_names[0]]
+    raw_pop = nodes.to_libsonata
+    node_ids = nodes.ids()[::2]
+
+    # Check enumerated as well as non-enumerated columns against value-to-index mapping
+    for column in ["layer", "mtype", "synapse_class"]:
+        mapping = test_module.get_enumeration_map(nodes, column)
+        values = raw_pop.get_attribute(column, raw_pop.select_all())
+        assert_array_equal(
+            test_module.get_enumeration(nodes, column), [mapping[_v] for _v in values]
+        )
+        values = raw_pop.get_attribute(column, libsonata.Selection(node_ids))
+        for ids in [node_ids, libsonata.Selection(node_ids)]:
+            assert_array_equal(test_module.get_attribute(nodes, column, ids), values)
+            assert_array_equal(
+                test_module.get_enumeration(nodes, column, ids), [mapping[_v] for _v in values]
+            )
+
+
+def test_get_enumeration_map():
+    circuit = Circuit(os.path.join(TEST_DATA_DIR, "circuit_sonata.json"))
+    nodes = circuit.nodes[circuit.nodes.population_names[0]]
+
+    for column in ["layer", "mtype"]:
+        values = test_module.get_enumeration_list(nodes, column)
+        assert values == sorted(nodes.property_values(column))
+        mapping = test_module.get_enumeration_map(nodes, column)
+        assert mapping == {_v: _i for _i, _v in enumerate(values)}
+
+        # Results are cached, but modifying them must not affect subsequent calls
+        values.append("INVALID")
+        mapping["INVALID"] = -1
+        assert "INVALID" not in test_module.get_enumeration_list(nodes, column)
+        assert "INVALID" not in test_module.get_enumeration_map(nodes, column)
+
+
+def test_quat2mat_batch():
+    np.random.seed(0)
+    wxyz = np.random.randn(100, 4)  # Not normalized
+    res = test_module._quat2mat_batch(wxyz)
+    assert res.shape == (100, 3, 3)
+    assert_array_almost_equal(res, np.stack(quaternion2mat(*wxyz.T)))
+
+
+def test_quat2mat_numba():
+    pytest.importorskip("numba")
+    np.random.seed(0)
+    wxyz = np.random.randn(test_module.QUAT2MAT_NUMBA_THRESHOLD + 1, 4)
+    quat_to_matrix_nb = test_module._get_quat2mat_nb()
+    assert quat_to_matrix_nb is not None
+    res = np.empty((wxyz.shape[0], 3, 3))
+    quat_to_matrix_nb(wxyz, res)
+    assert_array_almost_equal(res, test_module._quat2mat_batch(wxyz))
+    assert_array_almost_equal(test_module._quat2mat(wxyz), res)
+
+
+def test_rotate_vectors_from_quaternions():
+    np.random.seed(0)
+    wxyz = np.random.rand(50, 4) - 0.5
+    vecs = np.random.rand(50, 3) - 0.5
+    mats = test_module._quat2mat_batch(wxyz)
+    res = test_module.rotate_vectors_from_quaternions(wxyz, vecs)
+    assert_array_almost_equal(res, np.einsum("nij,nj->ni", mats, vecs))
+
+    # Single vector, rotated by all quaternions
+    res = test_module.rotate_vectors_from_quaternions(wxyz, [0.0, 1.0, 0.0])
+    assert_array_almost_equal(res, mats[:, :, 1])
+
+
+def test_orientations():
+    circuit = Circuit(os.path.join(TEST_DATA_DIR, "circuit_sonata.json"))
+    nodes = circuit.nodes[circuit.nodes.population_names[0]]
+
+    # Case 1: All nodes
+    res = test_module.orientations(nodes)
+    assert_array_almost_equal(np.array(res), np.stack(nodes.orientations()))
+
+    # Case 2: Node selection
+    node_ids = nodes.ids()[::2]
+    res = test_module.orientations(nodes, libsonata.Selection(node_ids))
+    assert_array_almost_equal(np.array(res), np.stack(nodes.orientations(node_ids)))
+
 
 def test_get_edges_population():
     circuit = Circuit(os.path.join(TEST_DATA_DIR, "circuit_sonata.json"))
@@ -47,6 +47,10 @@ def test_compute():
         assert_array_equal(res["common"]["tgt_gids"], tgt_ids, "ERROR: Target IDs mismatch!")
         assert isinstance(res["adj"]["data"], csc_matrix), "ERROR: CSC matrix expected!"
         assert isinstance(res["adj_cnt"]["data"], csc_matrix), "ERROR: CSC matrix expected!"
+        assert res["adj"]["data"].dtype == bool, "ERROR: Adjacency matrix data type mismatch!"
+        assert (
+            res["adj_cnt"]["data"].dtype == test_module.COUNT_DTYPE
+        ), "ERROR: Count matrix data type mismatch!"
         assert_array_equal(
             res["adj"]["data"].toarray(), ref_adj, "ERROR: Adjacency matrix mismatch!"
         )
@@ -85,3 +89,11 @@ def test_compute():
             res = test_module.compute(circuit, sel_src=sel_src, sel_dest=sel_tgt)
             ref_adj, ref_cnt = get_adj(edges_table, nodes[0].ids(sel_src), nodes[1].ids(sel_tgt))
             check_adj(res, ref_adj, ref_cnt, nodes[0].ids(sel_src), nodes[1].ids(sel_tgt))
+
+    # Case 4: Unsorted node ID selections
+    np.random.seed(0)
+    sel_src = np.random.permutation(nodes[0].ids())[: nodes[0].size // 2]
+    sel_tgt = np.random.permutation(nodes[1].ids())
+    res = test_module.compute(circuit, sel_src=sel_src, sel_dest=sel_tgt)
+    ref_adj, ref_cnt = get_adj(edges_table, sel_src, sel_tgt)
+    check_adj(res, ref_adj, ref_cnt, sel_src, sel_tgt)
@@ -0,0 +1,17 @@
+# This file is part of connectome-manipulator.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Open Brain Institute
+
+import connectome_manipulator.connectome_manipulation.executors as test_module
+
+
+def test_coerce():
+    assert test_module._coerce("4") == 4
+    assert isinstance(test_module._coerce("4"), int)
+    assert test_module._coerce("-1") == -1
+    assert test_module._coerce("0.5") == 0.5
+    assert test_module._coerce("1e9") == 1e9
+    assert isinstance(test_module._coerce("1e9"), float)
+    assert test_module._coerce("4GB") == "4GB"
+    assert test_module._coerce("tcp://localhost:8786") == "tcp://localhost:8786"